@@ -8,39 +8,88 @@ are available in every test without manual setup. Works with any Kailash project
 import os
 from pathlib import Path
 
+# Lookup table for bytes allowed in a .env key: [A-Za-z0-9._-].
+# Built once at import; indexed directly by byte value.
+_KEYCHARS = bytes(
+    1 if chr(b).isascii() and (chr(b).isalnum() or chr(b) in "._-") else 0 for b in range(256)
+)
+
 
 def pytest_configure(config):
-    """Load .env at the very start of the pytest session."""
+    """Load .env at the very start of the pytest session.
+
+    Set ``KAILASH_ENV_LOADED`` (done automatically once .env is applied) to skip loading.
+    """
+    if os.environ.get("KAILASH_ENV_LOADED"):
+        return
     env_path = Path(__file__).parent / ".env"
-    if env_path.exists():
-        _load_env(env_path)
+    try:
+        st = env_path.stat()
+    except FileNotFoundError:
+        return
+    if st.st_size == 0:
+        return
+    _load_env(_parse_env(env_path, st.st_size))
+
 
+def _load_env(env_vars: dict[str, str]):
+    """Inject parsed .env values into os.environ."""
+    # Only set if not already in environment (don't override explicit env)
+    pending = {key: val for key, val in env_vars.items() if key not in os.environ}
+    os.environ.update(pending)
+    os.environ["KAILASH_ENV_LOADED"] = "1"
 
-def _load_env(env_path: Path):
-    """Parse .env and inject into os.environ (lightweight, no dependencies)."""
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
+
+def _parse_env(env_path: Path, size: int = -1) -> dict[str, str]:
+    """Parse .env into a dict (lightweight, no dependencies).
+
+    Single forward scan over the raw bytes: line, key and comment boundaries are
+    located with ``bytes.find`` instead of splitting the file into a list of
+    lines, and only the key/value slices are decoded. ``size`` is the byte size
+    from an earlier stat(), used to size the read.
+    """
+    env_vars = {}
+    with env_path.open("rb") as f:
+        data = f.read(size)
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    n = len(data)
+    i = 3 if data.startswith(b"\xef\xbb\xbf") else 0  # UTF-8 BOM
+    while i < n:
+        if data[i] in b" \t\n\f\v":
+            i += 1
+            continue
+        eol = data.find(b"\n", i)
+        if eol == -1:
+            eol = n
+        if data.startswith(b"#", i):
+            i = eol + 1
             continue
         # Handle `export VAR=value` syntax
-        if line.startswith("export "):
-            line = line[7:].strip()
-        eq = line.find("=")
-        if eq == -1:
+        if data.startswith(b"export ", i):
+            i += 7
+            while i < eol and data[i] in b" \t":
+                i += 1
+        start = i
+        while i < eol and _KEYCHARS[data[i]]:
+            i += 1
+        key = data[start:i]
+        while i < eol and data[i] in b" \t":
+            i += 1
+        if not key or not data.startswith(b"=", i, eol):
+            # Malformed line (no key or no "="): skip
+            i = eol + 1
             continue
-        key = line[:eq].strip()
-        val = line[eq + 1 :].strip()
-        # Strip surrounding quotes
-        is_quoted = (val.startswith('"') and val.endswith('"') and len(val) >= 2) or (
-            val.startswith("'") and val.endswith("'") and len(val) >= 2
-        )
-        if is_quoted:
-            val = val[1:-1]
-        else:
-            # Strip inline comments for unquoted values (e.g. "value # comment")
-            comment_idx = val.find(" #")
-            if comment_idx > -1:
-                val = val[:comment_idx].strip()
-        # Only set if not already in environment (don't override explicit env)
-        if key not in os.environ:
-            os.environ[key] = val
+        i += 1
+        while i < eol and data[i] in b" \t":
+            i += 1
+        quote = data[i : i + 1]
+        close = data.rfind(quote, i + 1, eol) if quote in (b'"', b"'") else -1
+        # Quoted values are taken verbatim up to the last matching quote on the line
+        # (so embedded quotes survive); unquoted values have inline comments
+        # stripped (e.g. "value # comment")
+        val = data[i + 1 : close] if close != -1 else data[i:eol].partition(b" #")[0].rstrip()
+        # Keys are pure ASCII by construction (_KEYCHARS)
+        env_vars.setdefault(key.decode("ascii"), val.decode("utf-8"))  # first occurrence wins
+        i = eol + 1
+    return env_vars
@@ -6,321 +6,213 @@ Tests all documented patterns from skills against the real Kailash SDK.
 This validates that our documentation and skills are accurate.
 
 Usage:
-    python tests/sdk/test_sdk_patterns.py
+    pytest tests/sdk/test_sdk_patterns.py
+    python tests/sdk/test_sdk_patterns.py [pytest args, e.g. -x --tb=short -n auto]
 
 Requirements:
     - Kailash SDK installed (pip install kailash)
-    - .env file with required API keys
+    - .env file with required API keys (loaded by the root conftest.py)
 """
 
+import importlib
 import os
 import sys
 
+import pytest
+
 # SDK should be installed via: pip install kailash
-SDK_PATH = os.environ.get("KAILASH_SDK_PATH", "")
-if SDK_PATH and os.path.exists(SDK_PATH):
+# Set KAILASH_SDK_PATH (e.g. in .env) to test against a source checkout instead.
+SDK_PATH = os.environ.get("KAILASH_SDK_PATH")
+if SDK_PATH:
     sys.path.insert(0, os.path.join(SDK_PATH, "src"))
 
-# Load environment variables
 try:
-    from dotenv import load_dotenv
-
-    load_dotenv()
-except ImportError:
-    pass
-
-# Test tracking
-tests_passed = 0
-tests_failed = 0
-tests_skipped = 0
-
-
-def test(name):
-    """Test decorator"""
-
-    def decorator(fn):
-        def wrapper():
-            global tests_passed, tests_failed, tests_skipped
-            try:
-                fn()
-                print(f"  ✓ {name}")
-                tests_passed += 1
-            except AssertionError as e:
-                print(f"  ✗ {name}: {e}")
-                tests_failed += 1
-            except Exception as e:
-                print(f"  ⚠ {name}: SKIPPED - {e}")
-                tests_skipped += 1
-
-        return wrapper
-
-    return decorator
+    from kailash.runtime import AsyncLocalRuntime, LocalRuntime
+    from kailash.workflow.builder import WorkflowBuilder
+except ImportError as e:
+    # When run as a script, leave reporting to the pytest session started by main()
+    if __name__ != "__main__":
+        pytest.skip(
+            f"Kailash SDK not installed (pip install kailash): {e}", allow_module_level=True
+        )
 
 
 # ==============================================================================
-# CORE SDK PATTERN TESTS
+# FIXTURES
 # ==============================================================================
 
 
-def test_core_sdk_patterns():
-    """Test Core SDK patterns documented in 01-core-sdk skill."""
-    print("\nCore SDK Pattern Tests:")
-
-    @test("Import WorkflowBuilder")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-
-        assert WorkflowBuilder is not None
-
-    _()
-
-    @test("Import LocalRuntime")
-    def _():
-        from kailash.runtime import LocalRuntime
-
-        assert LocalRuntime is not None
-
-    _()
-
-    @test("Import AsyncLocalRuntime")
-    def _():
-        from kailash.runtime import AsyncLocalRuntime
-
-        assert AsyncLocalRuntime is not None
-
-    _()
+@pytest.fixture(scope="session")
+def trivial_built():
+    """Single PythonCodeNode workflow ("test": x = 1), built once per session."""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "test", {"code": "x = 1"})
+    return workflow.build()
 
-    @test("Import get_runtime")
-    def _():
-        from kailash.runtime import get_runtime
 
-        assert get_runtime is not None
+@pytest.fixture(scope="session")
+def runtime():
+    """Default LocalRuntime shared by tests that just need to execute a workflow."""
+    with LocalRuntime() as rt:
+        yield rt
 
-    _()
 
-    @test("Create workflow with 3-param add_node")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
+@pytest.fixture(scope="session")
+def runtime_attrs(runtime):
+    """Attribute names of the shared runtime, collected once with dir()."""
+    return frozenset(dir(runtime))
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "code1", {"code": "x = 1"})
-        built = workflow.build()
-        assert built is not None
 
-    _()
+# ==============================================================================
+# CORE SDK PATTERN TESTS (01-core-sdk skill)
+# ==============================================================================
 
-    @test("Create connection with 4-param add_connection")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "code1", {"code": "x = 1"})
-        workflow.add_node("PythonCodeNode", "code2", {"code": "y = x"})
-        workflow.add_connection("code1", "output", "code2", "input")
-        built = workflow.build()
-        assert built is not None
+@pytest.mark.parametrize(
+    "module,name",
+    [
+        ("kailash.workflow.builder", "WorkflowBuilder"),
+        ("kailash.runtime", "LocalRuntime"),
+        ("kailash.runtime", "AsyncLocalRuntime"),
+        ("kailash.runtime", "get_runtime"),
+        ("kailash.mcp_server", "MCPServer"),
+    ],
+)
+def test_symbol_imports(module, name):
+    """Documented import paths resolve"""
+    assert getattr(importlib.import_module(module), name) is not None
 
-    _()
 
-    @test("Execute workflow with LocalRuntime")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-        from kailash.runtime import LocalRuntime
+def test_add_node_three_params():
+    """Create workflow with 3-param add_node"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "code1", {"code": "x = 1"})
+    built = workflow.build()
+    assert built is not None
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "calc", {"code": "result = 42"})
 
-        runtime = LocalRuntime()
-        results, run_id = runtime.execute(workflow.build())
+def test_add_connection_four_params():
+    """Create connection with 4-param add_connection"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "code1", {"code": "x = 1"})
+    workflow.add_node("PythonCodeNode", "code2", {"code": "y = x"})
+    workflow.add_connection("code1", "output", "code2", "input")
+    built = workflow.build()
+    assert built is not None
 
-        assert run_id is not None
-        assert "calc" in results
 
-    _()
+def test_execute_with_local_runtime(runtime):
+    """Execute workflow with LocalRuntime"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "calc", {"code": "result = 42"})
 
-    @test("LocalRuntime returns (results, run_id) tuple")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-        from kailash.runtime import LocalRuntime
+    results, run_id = runtime.execute(workflow.build())
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "test", {"code": "x = 1"})
+    assert run_id is not None
+    assert "calc" in results
 
-        runtime = LocalRuntime()
-        output = runtime.execute(workflow.build())
 
-        assert isinstance(output, tuple)
-        assert len(output) == 2
-        results, run_id = output
-        assert isinstance(results, dict)
-        assert isinstance(run_id, str)
+def test_execute_returns_results_and_run_id(runtime, trivial_built):
+    """LocalRuntime returns (results, run_id) tuple"""
+    output = runtime.execute(trivial_built)
 
-    _()
+    assert isinstance(output, tuple)
+    assert len(output) == 2
+    results, run_id = output
+    assert isinstance(results, dict)
+    assert isinstance(run_id, str)
 
 
 # ==============================================================================
-# RUNTIME CONFIGURATION TESTS
+# RUNTIME CONFIGURATION TESTS (CLAUDE.md)
 # ==============================================================================
 
 
-def test_runtime_configuration():
-    """Test runtime configuration options documented in CLAUDE.md."""
-    print("\nRuntime Configuration Tests:")
-
-    @test("LocalRuntime with debug=True")
-    def _():
-        from kailash.runtime import LocalRuntime
-
-        runtime = LocalRuntime(debug=True)
-        assert runtime is not None
-
-    _()
-
-    @test("LocalRuntime with enable_cycles=True")
-    def _():
-        from kailash.runtime import LocalRuntime
-
-        runtime = LocalRuntime(enable_cycles=True)
-        assert runtime is not None
-
-    _()
-
-    @test("LocalRuntime with connection_validation='strict'")
-    def _():
-        from kailash.runtime import LocalRuntime
-
-        runtime = LocalRuntime(connection_validation="strict")
-        assert runtime is not None
-
-    _()
-
-    @test("LocalRuntime with conditional_execution='skip_branches'")
-    def _():
-        from kailash.runtime import LocalRuntime
-
-        runtime = LocalRuntime(conditional_execution="skip_branches")
-        assert runtime is not None
-
-    _()
-
-    @test("LocalRuntime has validate_workflow method")
-    def _():
-        from kailash.runtime import LocalRuntime
-
-        runtime = LocalRuntime()
-        assert hasattr(runtime, "validate_workflow")
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"debug": True},
+        {"enable_cycles": True},
+        {"connection_validation": "strict"},
+        {"conditional_execution": "skip_branches"},
+    ],
+    ids=lambda kwargs: ",".join(f"{k}={v}" for k, v in kwargs.items()),
+)
+def test_local_runtime_options(kwargs):
+    """LocalRuntime accepts documented configuration options"""
+    with LocalRuntime(**kwargs) as rt:
+        assert rt is not None
 
-    _()
 
-    @test("LocalRuntime has get_validation_metrics method")
-    def _():
-        from kailash.runtime import LocalRuntime
+def test_local_runtime_has_validate_workflow(runtime_attrs):
+    """LocalRuntime has validate_workflow method"""
+    assert "validate_workflow" in runtime_attrs
 
-        runtime = LocalRuntime()
-        assert hasattr(runtime, "get_validation_metrics")
 
-    _()
+def test_local_runtime_has_get_validation_metrics(runtime_attrs):
+    """LocalRuntime has get_validation_metrics method"""
+    assert "get_validation_metrics" in runtime_attrs
 
 
 # ==============================================================================
-# NODE TESTS
+# NODE TESTS (08-nodes-reference skill)
 # ==============================================================================
 
 
-def test_node_patterns():
-    """Test node patterns documented in 08-nodes-reference skill."""
-    print("\nNode Pattern Tests:")
+def test_python_code_node_exists(trivial_built):
+    """PythonCodeNode exists"""
+    # Nodes may be strings or objects with .id
+    node_ids = [n if isinstance(n, str) else n.id for n in trivial_built.nodes]
+    assert "test" in node_ids
 
-    @test("PythonCodeNode exists")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "test", {"code": "x = 1"})
-        built = workflow.build()
-        # Nodes may be strings or objects with .id
-        node_ids = [n if isinstance(n, str) else n.id for n in built.nodes]
-        assert "test" in node_ids
+def test_switch_node_exists():
+    """SwitchNode exists"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("SwitchNode", "switch", {"switch_variable": "x", "cases": {"a": "branch_a"}})
+    built = workflow.build()
+    node_ids = [n if isinstance(n, str) else n.id for n in built.nodes]
+    assert "switch" in node_ids
 
-    _()
 
-    @test("SwitchNode exists")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
+def test_http_request_node_exists():
+    """HTTPRequestNode exists"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("HTTPRequestNode", "http", {"url": "https://example.com", "method": "GET"})
+    built = workflow.build()
+    node_ids = [n if isinstance(n, str) else n.id for n in built.nodes]
+    assert "http" in node_ids
 
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "SwitchNode", "switch", {"switch_variable": "x", "cases": {"a": "branch_a"}}
-        )
-        built = workflow.build()
-        node_ids = [n if isinstance(n, str) else n.id for n in built.nodes]
-        assert "switch" in node_ids
-
-    _()
-
-    @test("HTTPRequestNode exists")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-
-        workflow = WorkflowBuilder()
-        workflow.add_node(
-            "HTTPRequestNode", "http", {"url": "https://example.com", "method": "GET"}
-        )
-        built = workflow.build()
-        node_ids = [n if isinstance(n, str) else n.id for n in built.nodes]
-        assert "http" in node_ids
 
-    _()
-
-    @test("PythonCodeNode can execute")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-        from kailash.runtime import LocalRuntime
-
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "log", {"code": "result = 'logged'"})
-        with LocalRuntime() as runtime:
-            results, _ = runtime.execute(workflow.build())
-            assert "log" in results
-
-    _()
+def test_python_code_node_executes(runtime):
+    """PythonCodeNode can execute"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "log", {"code": "result = 'logged'"})
+    results, _ = runtime.execute(workflow.build())
+    assert "log" in results
 
 
 # ==============================================================================
-# ASYNC RUNTIME TESTS
+# ASYNC RUNTIME TESTS (CLAUDE.md)
 # ==============================================================================
 
 
-def test_async_patterns():
-    """Test async runtime patterns documented in CLAUDE.md."""
-    print("\nAsync Runtime Tests:")
-
-    @test("AsyncLocalRuntime can be instantiated")
-    def _():
-        from kailash.runtime import AsyncLocalRuntime
+def test_async_local_runtime_instantiates():
+    """AsyncLocalRuntime can be instantiated"""
+    runtime = AsyncLocalRuntime()
+    assert runtime is not None
 
-        runtime = AsyncLocalRuntime()
-        assert runtime is not None
 
-    _()
+def test_async_local_runtime_has_execute_workflow_async():
+    """AsyncLocalRuntime has execute_workflow_async method"""
+    runtime = AsyncLocalRuntime()
+    assert "execute_workflow_async" in dir(runtime)
 
-    @test("AsyncLocalRuntime has execute_workflow_async method")
-    def _():
-        from kailash.runtime import AsyncLocalRuntime
 
-        runtime = AsyncLocalRuntime()
-        assert hasattr(runtime, "execute_workflow_async")
-
-    _()
-
-    @test("AsyncLocalRuntime with max_concurrent_nodes")
-    def _():
-        from kailash.runtime import AsyncLocalRuntime
-
-        runtime = AsyncLocalRuntime(max_concurrent_nodes=10)
-        assert runtime is not None
-
-    _()
+def test_async_local_runtime_max_concurrent_nodes():
+    """AsyncLocalRuntime with max_concurrent_nodes"""
+    runtime = AsyncLocalRuntime(max_concurrent_nodes=10)
+    assert runtime is not None
 
 
 # ==============================================================================
@@ -328,96 +220,49 @@ def test_async_patterns():
 # ==============================================================================
 
 
-def test_workflow_builder_features():
-    """Test WorkflowBuilder features."""
-    print("\nWorkflowBuilder Feature Tests:")
-
-    @test("WorkflowBuilder.build() returns workflow object")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "test", {"code": "x = 1"})
-        built = workflow.build()
-
-        # Verify it has required attributes
-        assert hasattr(built, "nodes")
-        assert hasattr(built, "id") or hasattr(built, "name")
-
-    _()
+def test_build_returns_workflow_object(trivial_built):
+    """WorkflowBuilder.build() returns workflow object"""
+    # Verify it has required attributes
+    assert hasattr(trivial_built, "nodes")
+    assert hasattr(trivial_built, "id") or hasattr(trivial_built, "name")
 
-    @test("Workflow has nodes attribute")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "test", {"code": "x = 1"})
-        built = workflow.build()
+def test_multiple_nodes():
+    """Multiple nodes can be added"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "node1", {"code": "a = 1"})
+    workflow.add_node("PythonCodeNode", "node2", {"code": "b = 2"})
+    workflow.add_node("PythonCodeNode", "node3", {"code": "c = 3"})
+    built = workflow.build()
 
-        assert hasattr(built, "nodes")
+    assert len(built.nodes) == 3
 
-    _()
 
-    @test("Multiple nodes can be added")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
+def test_connections_create_data_flow(runtime):
+    """Connections create data flow"""
+    workflow = WorkflowBuilder()
+    workflow.add_node("PythonCodeNode", "producer", {"code": "output = 42"})
+    workflow.add_node("PythonCodeNode", "consumer", {"code": "result = input * 2"})
+    workflow.add_connection("producer", "output", "consumer", "input")
 
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "node1", {"code": "a = 1"})
-        workflow.add_node("PythonCodeNode", "node2", {"code": "b = 2"})
-        workflow.add_node("PythonCodeNode", "node3", {"code": "c = 3"})
-        built = workflow.build()
+    results, _ = runtime.execute(workflow.build())
 
-        assert len(built.nodes) == 3
-
-    _()
-
-    @test("Connections create data flow")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-        from kailash.runtime import LocalRuntime
-
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "producer", {"code": "output = 42"})
-        workflow.add_node("PythonCodeNode", "consumer", {"code": "result = input * 2"})
-        workflow.add_connection("producer", "output", "consumer", "input")
-
-        runtime = LocalRuntime()
-        results, _ = runtime.execute(workflow.build())
-
-        # Verify consumer received the output
-        assert "consumer" in results
-
-    _()
+    # Verify consumer received the output
+    assert "consumer" in results
 
 
 # ==============================================================================
-# MCP INTEGRATION TESTS
+# MCP INTEGRATION TESTS (05-kailash-mcp skill)
 # ==============================================================================
 
 
-def test_mcp_patterns():
-    """Test MCP patterns documented in 05-kailash-mcp skill."""
-    print("\nMCP Integration Tests:")
-
-    @test("MCP server module exists")
-    def _():
-        from kailash.mcp_server import MCPServer
-
-        assert MCPServer is not None
-
-    _()
-
-    @test("MCP server has required methods")
-    def _():
-        from kailash.mcp_server import MCPServer
-
-        server = MCPServer(name="test-server")
-        assert hasattr(server, "tool")
-        assert hasattr(server, "resource")
-        assert hasattr(server, "prompt")
-
-    _()
+def test_mcp_server_has_required_methods():
+    """MCP server has required methods"""
+    # Optional module: a missing one fails test_symbol_imports, not the whole file
+    mcp_server = pytest.importorskip("kailash.mcp_server")
+    server = mcp_server.MCPServer(name="test-server")
+    attrs = set(dir(server))
+    assert {"tool", "resource", "prompt"} <= attrs
 
 
 # ==============================================================================
@@ -425,23 +270,11 @@ def test_mcp_patterns():
 # ==============================================================================
 
 
-def test_context_patterns():
-    """Test context manager patterns."""
-    print("\nContext Manager Pattern Tests:")
-
-    @test("Runtime can be used as context manager")
-    def _():
-        from kailash.workflow.builder import WorkflowBuilder
-        from kailash.runtime import LocalRuntime
-
-        workflow = WorkflowBuilder()
-        workflow.add_node("PythonCodeNode", "test", {"code": "x = 1"})
-
-        with LocalRuntime() as runtime:
-            results, run_id = runtime.execute(workflow.build())
-            assert run_id is not None
-
-    _()
+def test_runtime_context_manager(trivial_built):
+    """Runtime can be used as context manager"""
+    with LocalRuntime() as runtime:
+        results, run_id = runtime.execute(trivial_built)
+        assert run_id is not None
 
 
 # ==============================================================================
@@ -450,33 +283,8 @@ def test_context_patterns():
 
 
 def main():
-    """Run all SDK pattern tests."""
-    print("=" * 60)
-    print("SDK Pattern Validation Tests")
-    print("=" * 60)
-    print(f"SDK Path: {SDK_PATH}")
-    print("-" * 60)
-
-    # Run all test suites
-    test_core_sdk_patterns()
-    test_runtime_configuration()
-    test_node_patterns()
-    test_async_patterns()
-    test_workflow_builder_features()
-    test_mcp_patterns()
-    test_context_patterns()
-
-    # Summary
-    print("\n" + "=" * 60)
-    print(f"Results: {tests_passed} passed, {tests_failed} failed, {tests_skipped} skipped")
-    print("=" * 60)
-
-    if tests_failed > 0:
-        print("\n✗ SOME TESTS FAILED")
-        sys.exit(1)
-    else:
-        print("\n✓ ALL TESTS PASSED")
-        sys.exit(0)
+    """Run all SDK pattern tests (kept for `python tests/sdk/test_sdk_patterns.py`)."""
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
 
 
 if __name__ == "__main__":
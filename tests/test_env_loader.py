@@ -0,0 +1,88 @@
+"""
+Tests for the .env loader in the root conftest.py.
+
+Covers _parse_env() (the byte scanner) and _load_env() (injection into
+os.environ without overriding explicit values).
+"""
+
+import os
+
+import pytest
+
+from conftest import _load_env, _parse_env
+
+
+def _parse(tmp_path, data: bytes) -> dict[str, str]:
+    env_path = tmp_path / ".env"
+    env_path.write_bytes(data)
+    return _parse_env(env_path)
+
+
+def test_unquoted_values(tmp_path):
+    env = _parse(tmp_path, b"A=1\n  B = two  \nC=\nURL=postgresql://u:p@h:5432/db?x=1\n")
+    assert env == {"A": "1", "B": "two", "C": "", "URL": "postgresql://u:p@h:5432/db?x=1"}
+
+
+def test_quoted_values(tmp_path):
+    env = _parse(tmp_path, b'D="double quoted"\nS=\'single\'\nT="a"b"\nU="unterminated\n')
+    assert env["D"] == "double quoted"
+    assert env["S"] == "single"
+    # Only the surrounding quotes are stripped; embedded ones are kept
+    assert env["T"] == 'a"b'
+    # No closing quote on the line: taken as an unquoted value
+    assert env["U"] == '"unterminated'
+
+
+def test_quoted_values_with_embedded_quotes(tmp_path):
+    data = b'A="say \\"hi\\""\nK=\'it\'\'s\'\nJSON="{\\"k\\": \\"v\\"}"\n'
+    env = _parse(tmp_path, data)
+    assert env == {"A": 'say \\"hi\\"', "K": "it''s", "JSON": '{\\"k\\": \\"v\\"}'}
+
+
+def test_inline_comments(tmp_path):
+    data = b'# full line\n   # indented\nA=val # comment\nB=val#kept\nC="x # y"\nD="x y" # c\n'
+    env = _parse(tmp_path, data)
+    assert env == {"A": "val", "B": "val#kept", "C": "x # y", "D": "x y"}
+
+
+def test_export_prefix(tmp_path):
+    env = _parse(tmp_path, b"export A=1\nexport   B = 2\n")
+    assert env == {"A": "1", "B": "2"}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"A=1\r\nB=2\r\n", b"A=1\rB=2", b"\xef\xbb\xbfA=1\nB=2\n"],
+    ids=["crlf", "cr", "bom"],
+)
+def test_line_endings_and_bom(tmp_path, data):
+    assert _parse(tmp_path, data) == {"A": "1", "B": "2"}
+
+
+def test_utf8_values(tmp_path):
+    assert _parse(tmp_path, "NAME=café\n".encode()) == {"NAME": "café"}
+
+
+def test_duplicate_keys_first_wins(tmp_path):
+    assert _parse(tmp_path, b"DUP=first\nDUP=second\n") == {"DUP": "first"}
+
+
+def test_malformed_lines_skipped(tmp_path):
+    data = "NOEQ\nA B=2\nKÉY=1\n=nokey\nOK=yes".encode()
+    assert _parse(tmp_path, data) == {"OK": "yes"}
+
+
+def test_empty_file(tmp_path):
+    assert _parse(tmp_path, b"") == {}
+
+
+def test_load_env_keeps_explicit_values(monkeypatch):
+    monkeypatch.setenv("ENV_LOADER_EXPLICIT", "from-shell")
+    monkeypatch.delenv("ENV_LOADER_NEW", raising=False)
+    monkeypatch.delenv("KAILASH_ENV_LOADED", raising=False)
+
+    _load_env({"ENV_LOADER_EXPLICIT": "from-file", "ENV_LOADER_NEW": "from-file"})
+
+    assert os.environ["ENV_LOADER_EXPLICIT"] == "from-shell"
+    assert os.environ["ENV_LOADER_NEW"] == "from-file"
+    assert os.environ["KAILASH_ENV_LOADED"] == "1"